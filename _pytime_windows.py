@@ -25,8 +25,11 @@ if it is -1, mktime() should guess based on the date and time.
 import ctypes
 from ctypes import wintypes
 
+import collections
+import functools
+import sys
+import threading
 import types
-import _strptime
 
 
 __all__ = ('_STRUCT_TM_ITEMS', 'altzone', 'asctime', 'ctime', 'daylight', 'get_clock_info', 'gmtime', 
@@ -62,9 +65,26 @@ class TIME_ZONE_INFORMATION(ctypes.Structure):
     ]
 
 
+_kernel32.GetTimeZoneInformation.argtypes = (ctypes.POINTER(TIME_ZONE_INFORMATION),)
+_kernel32.GetTimeZoneInformation.restype = wintypes.DWORD
+
 _tzi = TIME_ZONE_INFORMATION()
-_kernel32.GetTimeZoneInformation(ctypes.byref(_tzi))
-altzone = (_tzi.Bias + _tzi.DaylightBias) * 60
+
+
+def _refresh_tz():
+    # (Re-)read the time zone used by mktime(), timezone, altzone and daylight.
+    global _tz_bias, _tz_daylight_bias, timezone, altzone, daylight
+    _kernel32.GetTimeZoneInformation(ctypes.byref(_tzi))
+    _tz_bias = _tzi.Bias
+    _tz_daylight_bias = _tzi.DaylightBias
+    timezone = _tz_bias * 60
+    altzone = (_tz_bias + _tz_daylight_bias) * 60
+    dd = _tzi.DaylightDate
+    daylight = int(bool(dd.wMonth or dd.wDay or dd.wDayOfWeek or dd.wHour or
+                        dd.wMinute or dd.wSecond or dd.wMilliseconds))
+
+
+_refresh_tz()
 
 _weekdays = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
 _weekdays_full = ['Monday', 'Tuesday', 'Wednesday', 'Thursday',
@@ -88,11 +108,8 @@ is used."""
     wday_str = _weekdays[tuple.tm_wday % 7]
     mon_str  = _months[tuple.tm_mon - 1]
     
-    return "%s %s %2d %02d:%02d:%02d %d" % (
-        wday_str, mon_str, tuple.tm_mday,
-        tuple.tm_hour, tuple.tm_min, tuple.tm_sec,
-        tuple.tm_year
-    )
+    return (f"{wday_str} {mon_str} {tuple.tm_mday:2d} "
+            f"{tuple.tm_hour:02d}:{tuple.tm_min:02d}:{tuple.tm_sec:02d} {tuple.tm_year}")
 
 
 def ctime(seconds=None, /) -> str:
@@ -105,11 +122,6 @@ not present, current time as returned by localtime() is used."""
     return asctime(localtime(seconds))
 
 
-_dd = _tzi.DaylightDate
-daylight = int(any([_dd.wMonth, _dd.wDay, _dd.wDayOfWeek, _dd.wHour,
-                    _dd.wMinute, _dd.wSecond, _dd.wMilliseconds]))
-
-
 def get_clock_info(name):
     """get_clock_info(name: str) -> dict
 
@@ -144,7 +156,7 @@ Get information of the specified clock."""
         return types.SimpleNamespace(
             resolution=1e-7,
             adjustable=True,
-            implementation="GetSystemTimeAsFileTime",
+            implementation="GetSystemTimePreciseAsFileTime",
             monotonic=False
         )
 
@@ -157,25 +169,52 @@ class FILETIME(ctypes.Structure):
                 ("dwHighDateTime", ctypes.c_ulong)]
 
 
-def _calc_weekday(year, month, day):
-    t = [0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4]
-    y = year - (month < 3)
-    w = (y + y//4 - y//100 + y//400 + t[month-1] + day) % 7
-    return (w - 1) % 7
+def _is_leap(year):
+    return not year & 3 and (year % 25 != 0 or not year & 15)
+
 
+_DAYS_IN_MONTH      = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DAYS_IN_MONTH_LEAP = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+_CUM_DAYS_COMMON = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_CUM_DAYS_LEAP   = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
 
-def _is_leap(year):
-    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
 
+# Howard Hinnant's days_from_civil/civil_from_days: eras of 400 years
+# starting 0000-03-01, with days counted from 1970-01-01.
 
-_month_days = [31,28,31,30,31,30,31,31,30,31,30,31]
+def _days_from_civil(year, month, day):
+    year -= month <= 2
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153*((month + 9) % 12) + 2)//5 + day - 1
+    doe = yoe*365 + yoe//4 - yoe//100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _civil_from_days(days):
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe//1460 + doe//36524 - doe//146096) // 365
+    year = yoe + era * 400
+    doy = doe - (365*yoe + yoe//4 - yoe//100)
+    mp = (5*doy + 2) // 153
+    day = doy - (153*mp + 2)//5 + 1
+    if mp < 10:
+        month = mp + 3
+        yday = doy + 60 + _is_leap(year)
+    else:
+        month = mp - 9
+        year += 1
+        yday = doy - 305
+    wday = (days + 3) % 7  # 1970-01-01 was a Thursday
+    return year, month, day, wday, yday
 
 
 def _calc_yday(year, month, day):
-    mdays = _month_days.copy()
-    if _is_leap(year):
-        mdays[1] = 29
-    return day + sum(mdays[:month-1])
+    cum_days = _CUM_DAYS_LEAP if _is_leap(year) else _CUM_DAYS_COMMON
+    return day + cum_days[month-1]
 
 
 def gmtime(seconds=None, /) -> tuple:
@@ -195,6 +234,10 @@ attributes only."""
 
 
 _EPOCH_DIFF = 11644473600
+_EPOCH_DIFF_TICKS = _EPOCH_DIFF * 10_000_000  # in 100 ns FILETIME units
+
+_kernel32.GetLocalTime.argtypes = (ctypes.POINTER(SYSTEMTIME),)
+_kernel32.GetLocalTime.restype = None
 
 
 def localtime(seconds=None, /) -> tuple:
@@ -204,35 +247,15 @@ def localtime(seconds=None, /) -> tuple:
 Convert seconds since the Epoch to a time tuple expressing local time.
 When 'seconds' is not passed in, convert the current time instead."""
 
-    mdays = _month_days.copy()
     if seconds is not None:
         second = seconds % 60
         seconds //= 60
         minute = seconds % 60
         seconds //= 60
         hour = seconds % 24
-        days = seconds // 24
-    
-        year = 1970
-        while 1:
-            is_leap = _is_leap(year)
-            year_days = 366 if is_leap else 365
-            if days >= year_days:
-                days -= year_days
-                year += 1
-            else:
-                break
-    
-        if _is_leap(year):
-            mdays[1] = 29
-        month = 1
-        for mlen in mdays:
-            if days + 1 > mlen:
-                days -= mlen
-                month += 1
-            else:
-                break
-        day = days + 1
+        days = int(seconds // 24)
+
+        year, month, day, tm_wday, tm_yday = _civil_from_days(days)
 
     else:
         st = SYSTEMTIME()
@@ -240,21 +263,21 @@ When 'seconds' is not passed in, convert the current time instead."""
         _kernel32.GetLocalTime(ctypes.byref(st))
     
         year, month, day = st.wYear, st.wMonth, st.wDay
+        tm_wday = (st.wDayOfWeek + 6) % 7  # SYSTEMTIME counts from Sunday
 
         if day == 0:
             month -= 1
             if month == 0:
                 month = 12
                 year -= 1
+            tm_wday = (tm_wday - 1) % 7
                 
-            if _is_leap(year):
-                mdays[1] = 29
+            mdays = _DAYS_IN_MONTH_LEAP if _is_leap(year) else _DAYS_IN_MONTH
             day = mdays[month-1]
 
         hour, minute, second = st.wHour, st.wMinute, st.wSecond
+        tm_yday = _calc_yday(year, month, day)
     
-    tm_wday = _calc_weekday(year, month, day)
-    tm_yday = _calc_yday(year, month, day)
     tm_isdst = 0
 
     return struct_time((
@@ -275,23 +298,18 @@ of the timezone or altzone attributes on the time module."""
     year, mon, mday = tuple.tm_year, tuple.tm_mon, tuple.tm_mday
     hour, minute, sec = tuple.tm_hour, tuple.tm_min, tuple.tm_sec
 
-    days = 0
-    for y in range(1970, year):
-        days += 366 if _is_leap(y) else 365
-
-    mdays = _month_days.copy()
-    if _is_leap(year):
-        mdays[1] = 29
-    
-    days += sum(mdays[:mon-1])
-
-    days += (mday - 1)
+    days = _days_from_civil(year, mon, mday)
     local_secs = days * 86400 + hour * 3600 + minute * 60 + sec
 
     offset_sec = _get_local_utc_offset_seconds(tuple.tm_isdst)
     return local_secs + offset_sec
 
 
+_kernel32.QueryPerformanceFrequency.argtypes = (ctypes.POINTER(ctypes.c_longlong),)
+_kernel32.QueryPerformanceFrequency.restype = wintypes.BOOL
+_kernel32.QueryPerformanceCounter.argtypes = (ctypes.POINTER(ctypes.c_longlong),)
+_kernel32.QueryPerformanceCounter.restype = wintypes.BOOL
+
 _freq = ctypes.c_longlong()
 if not _kernel32.QueryPerformanceFrequency(ctypes.byref(_freq)):
     raise OSError("QueryPerformanceFrequency failed")
@@ -299,15 +317,33 @@ if not _kernel32.QueryPerformanceFrequency(ctypes.byref(_freq)):
 _frequency = _freq.value
 
 
+class _ClockBuffers(threading.local):
+    # Output buffers for the clock calls, allocated once per thread.
+    def __init__(self):
+        self.counter = ctypes.c_longlong()
+        self.counter_ref = ctypes.byref(self.counter)
+        self.filetime = FILETIME()
+        self.filetime_ref = ctypes.byref(self.filetime)
+        self.creation = FILETIME()
+        self.exit = FILETIME()
+        self.kernel = FILETIME()
+        self.user = FILETIME()
+        self.cpu_time_refs = (ctypes.byref(self.creation), ctypes.byref(self.exit),
+                              ctypes.byref(self.kernel), ctypes.byref(self.user))
+
+
+_buffers = _ClockBuffers()
+
+
 def monotonic() -> float:
     """monotonic() -> float
 
 Monotonic clock, cannot go backward."""
 
-    counter = ctypes.c_longlong()
-    if not _kernel32.QueryPerformanceCounter(ctypes.byref(counter)):
+    buf = _buffers
+    if not _kernel32.QueryPerformanceCounter(buf.counter_ref):
         raise OSError("QueryPerformanceCounter failed")
-    return counter.value / _frequency
+    return buf.counter.value / _frequency
 
 
 def monotonic_ns() -> int:
@@ -315,7 +351,10 @@ def monotonic_ns() -> int:
 
 Monotonic clock, cannot go backward, as nanoseconds."""
 
-    return int(monotonic() * 1_000_000_000)
+    buf = _buffers
+    if not _kernel32.QueryPerformanceCounter(buf.counter_ref):
+        raise OSError("QueryPerformanceCounter failed")
+    return buf.counter.value * 1_000_000_000 // _frequency
 
 
 perf_counter = monotonic
@@ -323,14 +362,8 @@ perf_counter = monotonic
 perf_counter_ns = monotonic_ns
 
 
-def _filetime_to_seconds(ft):
-    high = ft.dwHighDateTime
-    low  = ft.dwLowDateTime
-    ticks = (high << 32) | low
-    return ticks / 10_000_000
-
-
 _kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+_kernel32.GetCurrentThread.restype = wintypes.HANDLE
 _kernel32.GetProcessTimes.argtypes = (
     wintypes.HANDLE,      # hProcess
     ctypes.POINTER(FILETIME),  # lpCreationTime
@@ -339,27 +372,21 @@ _kernel32.GetProcessTimes.argtypes = (
     ctypes.POINTER(FILETIME),  # lpUserTime
 )
 _kernel32.GetProcessTimes.restype = wintypes.BOOL
+_kernel32.GetThreadTimes.argtypes = (
+    wintypes.HANDLE,      # hThread
+    ctypes.POINTER(FILETIME),  # lpCreationTime
+    ctypes.POINTER(FILETIME),  # lpExitTime
+    ctypes.POINTER(FILETIME),  # lpKernelTime
+    ctypes.POINTER(FILETIME),  # lpUserTime
+)
+_kernel32.GetThreadTimes.restype = wintypes.BOOL
 
+# Pseudo-handles: constants that always refer to the calling process/thread.
+_CURRENT_PROCESS = _kernel32.GetCurrentProcess()
+_CURRENT_THREAD  = _kernel32.GetCurrentThread()
 
-def _get_user_cpu_time(current, times):
-    hProc = getattr(_kernel32, current)()
-    
-    creation = FILETIME()
-    exit     = FILETIME()
-    kernel   = FILETIME()
-    user     = FILETIME()
-
-    ok = getattr(_kernel32, times)(
-        hProc,
-        ctypes.byref(creation),
-        ctypes.byref(exit),
-        ctypes.byref(kernel),
-        ctypes.byref(user)
-    )
-    if not ok:
-        raise ctypes.WinError(ctypes.get_last_error())
-    
-    return _filetime_to_seconds(kernel) + _filetime_to_seconds(user)
+_GetProcessTimes = _kernel32.GetProcessTimes
+_GetThreadTimes  = _kernel32.GetThreadTimes
 
 
 def process_time() -> float:
@@ -367,7 +394,12 @@ def process_time() -> float:
 
 Process time for profiling: sum of the kernel and user-space CPU time."""
     
-    return _get_user_cpu_time("GetCurrentProcess", "GetProcessTimes")
+    buf = _buffers
+    if not _GetProcessTimes(_CURRENT_PROCESS, *buf.cpu_time_refs):
+        raise ctypes.WinError(ctypes.get_last_error())
+    kernel, user = buf.kernel, buf.user
+    return (((kernel.dwHighDateTime << 32) | kernel.dwLowDateTime) +
+            ((user.dwHighDateTime << 32) | user.dwLowDateTime)) / 10_000_000
 
 
 def process_time_ns() -> int:
@@ -423,6 +455,9 @@ _kernel32.WaitForSingleObject.restype = wintypes.DWORD
 _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
 _kernel32.CloseHandle.restype  = wintypes.BOOL
 
+_kernel32.Sleep.argtypes = (wintypes.DWORD,)
+_kernel32.Sleep.restype = None
+
 hTimer = _kernel32.CreateWaitableTimerExW(
     None,
     None,
@@ -433,6 +468,10 @@ hTimer = _kernel32.CreateWaitableTimerExW(
 if not hTimer:
     raise ctypes.WinError(ctypes.get_last_error())
 
+# Below this many seconds, arming the waitable timer and waking up again
+# costs more than the delay itself, so sleep() spins on the QPC instead.
+_SPIN_THRESHOLD = 100e-6
+
 
 def sleep(seconds, /):
     """sleep(seconds)
@@ -443,6 +482,16 @@ a floating point number for subsecond precision."""
     if seconds == 0:
         _kernel32.Sleep(0)
         return
+
+    if 0 < seconds < _SPIN_THRESHOLD:
+        buf = _buffers
+        counter, counter_ref = buf.counter, buf.counter_ref
+        qpc = _kernel32.QueryPerformanceCounter
+        qpc(counter_ref)
+        target = counter.value + int(seconds * _frequency)
+        while counter.value < target:
+            qpc(counter_ref)
+        return
     
     li = LARGE_INTEGER()
     li.QuadPart = -int(seconds * 10_000_000)
@@ -455,32 +504,52 @@ a floating point number for subsecond precision."""
         raise ctypes.WinError(ctypes.get_last_error())
 
 
-def _zero(n, width=2):
-    return str(n).zfill(width)
-
-
-def _yday(tm):
-    return str(tm.tm_yday).zfill(3)
-
-
 _strtime_handlers = {
     'Y': lambda tm: str(tm.tm_year),
-    'y': lambda tm: _zero(tm.tm_year % 100),
-    'm': lambda tm: _zero(tm.tm_mon),
-    'd': lambda tm: _zero(tm.tm_mday),
-    'H': lambda tm: _zero(tm.tm_hour),
-    'M': lambda tm: _zero(tm.tm_min),
-    'S': lambda tm: _zero(tm.tm_sec),
+    'y': lambda tm: f"{tm.tm_year % 100:02d}",
+    'm': lambda tm: f"{tm.tm_mon:02d}",
+    'd': lambda tm: f"{tm.tm_mday:02d}",
+    'H': lambda tm: f"{tm.tm_hour:02d}",
+    'M': lambda tm: f"{tm.tm_min:02d}",
+    'S': lambda tm: f"{tm.tm_sec:02d}",
     'a': lambda tm: _weekdays[tm.tm_wday],
     'A': lambda tm: _weekdays_full[tm.tm_wday],
     'b': lambda tm: _months[tm.tm_mon - 1],
     'B': lambda tm: _months_full[tm.tm_mon - 1],
     'w': lambda tm: str(tm.tm_wday),       # 0=Mon ¡­ 6=Sun
-    'j': lambda tm: _yday(tm),              # day of year
+    'j': lambda tm: f"{tm.tm_yday:03d}",   # day of year
     '%': lambda tm: '%',
     }
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_format(format):
+    # Split a format into (literal, None) and (None, handler) steps.
+    steps = []
+    literal = []
+    i = 0
+    L = len(format)
+    while i < L:
+        if format[i] == '%' and i+1 < L:
+            code = format[i+1]
+            fn = _strtime_handlers.get(code)
+            if fn:
+                if literal:
+                    steps.append((''.join(literal), None))
+                    literal = []
+                steps.append((None, fn))
+            else:
+                literal.append('%' + code)
+            i += 2
+        else:
+            literal.append(format[i])
+            i += 1
+
+    if literal:
+        steps.append((''.join(literal), None))
+    return tuple(steps)
+
+
 def strftime(format, tuple=None, /) -> str:
     """strftime(format[, tuple]) -> string
 
@@ -508,30 +577,31 @@ Commonly used format codes:
 Other codes may be available on your platform.  See documentation for
 the C library strftime function.
 """
-    res = []
-    i = 0
-    L = len(format)
-    while i < L:
-        if format[i] == '%' and i+1 < L:
-            code = format[i+1]
-            fn = _strtime_handlers.get(code)
-            if fn:
-                res.append(fn(tuple))
-            else:
-                res.append('%' + code)
-            i += 2
-        else:
-            res.append(format[i])
-            i += 1
+    return ''.join([lit if fn is None else fn(tuple)
+                    for lit, fn in _compile_format(format)])
+
+
+def strptime(*args, **kwargs):
+    """strptime(string, format) -> struct_time
 
-    return ''.join(res)
+Parse a string to a time tuple according to a format specification.
+See the library reference manual for formatting codes (same as
+strftime())."""
 
+    # _strptime is only imported, and pointed at this module, on first use.
+    global strptime
+    import _strptime
+    _strptime.time = sys.modules[__name__]
+    strptime = _strptime._strptime_time
+    return strptime(*args, **kwargs)
 
-_strptime.time = __import__(__name__)
-strptime = _strptime._strptime
 
+_StructTimeBase = collections.namedtuple(
+    '_StructTimeBase',
+    'tm_year tm_mon tm_mday tm_hour tm_min tm_sec tm_wday tm_yday tm_isdst')
 
-class struct_time(tuple):
+
+class struct_time(_StructTimeBase):
     """The time value as returned by gmtime(), localtime(), and strptime(), and
  accepted by asctime(), mktime() and strftime().  May be considered as a
  sequence of 9 integers.
@@ -541,22 +611,18 @@ class struct_time(tuple):
  field tm_year is the actual year, not year - 1900.  See individual
  fields' descriptions for details."""
     
-    __match_args__ = ('tm_year', 'tm_mon', 'tm_mday', 'tm_hour', 'tm_min', 
-                      'tm_sec', 'tm_wday', 'tm_yday', 'tm_isdst')
+    __slots__ = ()
 
-    def __new__(cls, *args, **kwargs):
-        inst = super().__new__(cls)
-        inst.tm_year, inst.tm_mon, inst.tm_mday, inst.tm_hour, inst.tm_min, \
-            inst.tm_sec, inst.tm_wday, inst.tm_yday, inst.tm_isdst = args[0]
-        
-        return inst
+    def __new__(cls, sequence, /):
+        # tm_zone and tm_gmtoff (items 10 and 11) are accepted but not kept.
+        n = len(sequence)
+        if not 9 <= n <= _STRUCT_TM_ITEMS:
+            raise TypeError(f"{_module_name}.struct_time() takes a 9 to "
+                            f"{_STRUCT_TM_ITEMS}-sequence ({n}-sequence given)")
+        return super().__new__(cls, *sequence[:9])
 
     def __reduce__(self):
-        return (struct_time, (self.tm_year, self.tm_mon, self.tm_mday,
-                   self.tm_hour, self.tm_min, self.tm_sec,
-                   self.tm_wday, self.tm_yday, self.tm_isdst),
-                   {'tm_zone': None, 'tm_gmtoff': None}
-               )
+        return (struct_time, (tuple(self),))
     
     def __repr__(self):
         return f"{_module_name}.struct_time(tm_year={self.tm_year}, tm_mon={self.tm_mon}, " \
@@ -569,7 +635,12 @@ def thread_time() -> float:
 
 Thread time for profiling: sum of the kernel and user-space CPU time."""
     
-    return _get_user_cpu_time("GetCurrentThread", "GetThreadTimes")
+    buf = _buffers
+    if not _GetThreadTimes(_CURRENT_THREAD, *buf.cpu_time_refs):
+        raise ctypes.WinError(ctypes.get_last_error())
+    kernel, user = buf.kernel, buf.user
+    return (((kernel.dwHighDateTime << 32) | kernel.dwLowDateTime) +
+            ((user.dwHighDateTime << 32) | user.dwLowDateTime)) / 10_000_000
 
 
 def thread_time_ns() -> int:
@@ -581,15 +652,21 @@ sum of the kernel and user-space CPU time."""
     return int(thread_time() * 1_000_000_000)
 
 
+_kernel32.GetSystemTimePreciseAsFileTime.argtypes = (ctypes.POINTER(FILETIME),)
+_kernel32.GetSystemTimePreciseAsFileTime.restype = None
+
+
 def time() -> float:
     """time() -> floating point number
 
 Return the current time in seconds since the Epoch.
 Fractions of a second may be present if the system clock provides them."""
     
-    ft = FILETIME()
-    _kernel32.GetSystemTimeAsFileTime(ctypes.byref(ft))
-    return _filetime_to_seconds(ft) - _EPOCH_DIFF
+    buf = _buffers
+    _kernel32.GetSystemTimePreciseAsFileTime(buf.filetime_ref)
+    ft = buf.filetime
+    ticks = (ft.dwHighDateTime << 32) | ft.dwLowDateTime
+    return (ticks - _EPOCH_DIFF_TICKS) * 1e-7
 
 
 def time_ns() -> int:
@@ -597,21 +674,52 @@ def time_ns() -> int:
 
 Return the current time in nanoseconds since the Epoch."""
     
-    return int(time() * 1_000_000_000)
+    buf = _buffers
+    _kernel32.GetSystemTimePreciseAsFileTime(buf.filetime_ref)
+    ft = buf.filetime
+    ticks = (ft.dwHighDateTime << 32) | ft.dwLowDateTime
+    return (ticks - _EPOCH_DIFF_TICKS) * 100
+
+
+class KSYSTEM_TIME(ctypes.Structure):
+    _fields_ = [
+        ("LowPart", wintypes.ULONG),
+        ("High1Time", wintypes.LONG),
+        ("High2Time", wintypes.LONG),
+    ]
+
+
+# KUSER_SHARED_DATA.SystemTime, mapped read-only into every process.
+_KUSER_SYSTEMTIME = 0x7FFE0014
+_shared_system_time = KSYSTEM_TIME.from_address(_KUSER_SYSTEMTIME)
+
+
+def time_coarse() -> float:
+    """time_coarse() -> floating point number
+
+Return the current time in seconds since the Epoch, read from the shared
+user data page without a system call.  Only updated once per clock tick
+(typically 15.6 ms); use time() when finer resolution is needed."""
+
+    st = _shared_system_time
+    while True:
+        # The kernel writes High2Time, LowPart, then High1Time, so the
+        # value is consistent when both high parts agree.
+        high = st.High1Time
+        low = st.LowPart
+        if high == st.High2Time:
+            break
+    return (((high << 32) | low) - _EPOCH_DIFF_TICKS) * 1e-7
 
 
 def _get_local_utc_offset_seconds(isdst_flag):
-    _kernel32.GetTimeZoneInformation(ctypes.byref(_tzi))
-    bias = _tzi.Bias
+    bias = _tz_bias
     if isdst_flag > 0:
-        bias += _tzi.DaylightBias
+        bias += _tz_daylight_bias
 
     return bias * 60
 
 
-timezone = _get_local_utc_offset_seconds(0)
-
-
 class DYNAMIC_TIME_ZONE_INFORMATION(ctypes.Structure):
     _fields_ = [
         ("Bias", wintypes.LONG),